@@ -20,8 +20,11 @@
 # add these directories to sys.path here. If the directory is relative to the
 # documentation root, use os.path.abspath to make it absolute, like shown here.
 #
+import filecmp
 import os
+import shutil
 import sys
+import tempfile
 
 # add `manpages` directory to sys.path
 import pathlib
@@ -117,7 +120,15 @@ py_bindings_dir = os.path.normpath(os.path.join(script_dir, "../src/bindings/pyt
 sys.path.insert(0, py_bindings_dir)
 
 # run api doc
-def run_apidoc(_):
+def run_apidoc(app):
+    # Manual pages never include the Python API documentation, so for the
+    # man builder skip apidoc and exclude the python/ pages entirely. O/w
+    # autodoc imports every documented module, through the mocks set up in
+    # autodoc_mock_imports, only for the result to be discarded.
+    if app.builder.name == "man":
+        app.config.exclude_patterns.append("python")
+        return
+
     # Move import inside so that `gen-cmdhelp.py` can exec this file in LGTM.com
     # without sphinx installed
     # pylint: disable=import-outside-toplevel
@@ -130,7 +141,18 @@ def run_apidoc(_):
         build_dir = script_dir
     output_path = os.path.join(build_dir, 'python', 'autogenerated')
     exclusions = [os.path.join(py_bindings_dir, 'setup.py'),]
-    main(['-e', '-f', '-M', '-T', '-o', output_path, py_bindings_dir] + exclusions)
+
+    # Generate into a temporary directory and only copy over files whose
+    # content changed. Overwriting every file on each build bumps mtimes
+    # and makes Sphinx re-read all of the generated pages.
+    with tempfile.TemporaryDirectory() as tmpdir:
+        main(['-e', '-f', '-M', '-T', '-o', tmpdir, py_bindings_dir] + exclusions)
+        os.makedirs(output_path, exist_ok=True)
+        for name in os.listdir(tmpdir):
+            src = os.path.join(tmpdir, name)
+            dst = os.path.join(output_path, name)
+            if not os.path.exists(dst) or not filecmp.cmp(src, dst, shallow=False):
+                shutil.copyfile(src, dst)
 
 def man_role(name, rawtext, text, lineno, inliner, options={}, content=[]):
     section = int(name[-1])
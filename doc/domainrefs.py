@@ -70,3 +70,7 @@ def role(config, role, rawtext, text, lineno, inliner, options={}, content=[]):
 def setup(app):
     for name, info in app.config._raw_config['domainrefs'].items():
         app.add_role(name, functools.partial(role, info))
+    return {
+        'parallel_read_safe': True,
+        'parallel_write_safe': True,
+    }
@@ -44,7 +44,7 @@ class BulkSubmitCmd(base.SubmitBulkCmd):
         self.parser.add_argument(
             "--define",
             action="append",
-            type=lambda kv: kv.split("="),
+            type=lambda kv: kv.split("=", 1),
             dest="methods",
             default=[],
             help="Define a named method for transforming any input, "
@@ -8,7 +8,7 @@
 # SPDX-License-Identifier: LGPL-3.0
 ##############################################################
 
-import glob
+import functools
 import inspect
 import os
 import sys
@@ -19,6 +19,102 @@ from pydoc import ttypager
 from flux.conf_builtin import conf_builtin_get
 from flux.importer import import_path, import_plugins
 
+# Modules imported from plugin files, keyed by path, along with the mtime of
+# the file at import time and the plugin classes found in the module.
+# Multiple registries may be created in one process (e.g. by Jobspec helpers
+# or the jobspec validator), so avoid re-executing each plugin file unless it
+# has changed on disk.
+_MODULE_CACHE = {}
+
+# While _import_plugin_path() imports a plugin file, the CLIPlugin subclasses
+# created by the import are appended to this list by
+# CLIPlugin.__init_subclass__(). It is None at all other times, so that no
+# references to plugin classes are retained.
+_CREATED_SUBCLASSES = None
+
+
+@functools.lru_cache(maxsize=1)
+def _builtin_searchpath():
+    """Return the system default CLI plugin search path
+
+    The builtin config values cannot change within a process, so look
+    them up only once.
+    """
+    sysdir = conf_builtin_get("confdir")
+    builtindir = conf_builtin_get("libexecdir")
+    return (f"{sysdir}/cli/plugins", f"{builtindir}/cli/plugins")
+
+
+def _plugin_classes(module, created=None):
+    """Return the CLIPlugin classes provided by ``module``
+
+    If the module declares ``__flux_cli_plugins__``, use that list directly.
+    Otherwise, return the public CLIPlugin subclasses defined by the module,
+    skipping anything imported from elsewhere, sorted by name as with dir().
+    ``created`` is the list of subclasses created while importing the module,
+    if known. If not, the module namespace is scanned instead.
+    """
+    entries = getattr(module, "__flux_cli_plugins__", None)
+    if entries is not None:
+        return list(entries)
+    if created is None:
+        created = [
+            entry
+            for entry in vars(module).values()
+            if isinstance(entry, type) and issubclass(entry, CLIPlugin)
+        ]
+    name = module.__name__
+    return sorted(
+        (
+            cls
+            for cls in created
+            if cls.__module__ == name and not cls.__name__.startswith("_")
+        ),
+        key=lambda cls: cls.__name__,
+    )
+
+
+def _find_plugin_files(plugindir):
+    """Return a list of (path, mtime) for each ``*.py`` file in plugindir
+
+    A plugin directory which does not exist or cannot be opened is skipped,
+    as with glob(). Errors on individual entries (e.g. a symlink loop) are
+    raised so that a broken plugin is not silently ignored.
+    """
+    try:
+        entries = os.scandir(plugindir)
+    except OSError:
+        return []
+    with entries:
+        return [
+            (entry.path, entry.stat().st_mtime_ns)
+            for entry in entries
+            if entry.name.endswith(".py")
+            and not entry.name.startswith(".")
+            and entry.is_file()
+        ]
+
+
+def _import_plugin_path(path, mtime):
+    """Import a plugin module from ``path`` last modified at ``mtime``
+
+    Returns a tuple of the module and the list of CLIPlugin classes it
+    provides. A previous import is reused if the file is unchanged.
+    """
+    cached = _MODULE_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1], cached[2]
+    global _CREATED_SUBCLASSES  # pylint: disable=global-statement
+    saved = _CREATED_SUBCLASSES
+    _CREATED_SUBCLASSES = created = []
+    try:
+        module = import_path(path)
+    finally:
+        _CREATED_SUBCLASSES = saved
+    classes = _plugin_classes(module, created)
+    _MODULE_CACHE[path] = (mtime, module, classes)
+    return module, classes
+
 
 class PluginArgsProxy:
     """Per-plugin proxy for the args namespace passed to plugin callbacks.
@@ -62,9 +158,10 @@ class CLIPluginOption:
     def __init__(self, name, prefix, **kwargs):
         if not name.startswith("--"):
             raise ValueError("Plugins must register only long options.")
+        # name without the leading "--", which was checked above:
+        basename = name[2:]
         if prefix:
-            ## only replace the first occurrence of --
-            self.name = name.replace("--", f"--{prefix}-", 1)
+            self.name = f"--{prefix}-{basename}"
         else:
             self.name = name
         if "dest" not in kwargs:
@@ -72,7 +169,7 @@ class CLIPluginOption:
             # callers see in --help output and no inadvertent conflicts
             # with builtin options dest occur. Store the unprefixed form
             # so PluginArgsProxy can alias transparently.
-            self._unprefixed_dest = name[2:].replace("-", "_")
+            self._unprefixed_dest = basename.replace("-", "_")
             kwargs["dest"] = self.name[2:].replace("-", "_")
         else:
             # Explicit dest= means the plugin author chose the name
@@ -91,19 +188,33 @@ class CLIPlugin(ABC):  # pragma no cover
     A plugin should derive from this class and implement one or more
     base methods (described below)
 
+    A plugin module may list the plugin classes it provides in a
+    module-level ``__flux_cli_plugins__`` sequence. Otherwise, every public
+    CLIPlugin subclass defined in the module is loaded.
+
+    The attributes below are stored in ``__slots__``. A plugin which does
+    not need any further per-instance attributes may declare an empty
+    ``__slots__`` to avoid allocating an instance ``__dict__``.
+
     Attributes:
         prog (str): command-line subcommand for which the plugin is active,
-            e.g. "submit", "run", "alloc", "batch", "bulksubmit"
+            e.g. "submit", "run", "alloc", "batch", "bulksubmit". The
+            registry strips any leading "flux " before creating plugins.
         prefix (str): By default, ``--ex-`` is added as a prefix to ensure
             plugin-provided options are namespaced. The prefix may be
             overridden with a site or project name.
 
     """
 
+    __slots__ = ("prog", "path", "prefix", "version", "options")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if _CREATED_SUBCLASSES is not None:
+            _CREATED_SUBCLASSES.append(cls)
+
     def __init__(self, prog, prefix="ex", version=None):
         self.prog = prog
-        if prog.startswith("flux "):
-            self.prog = prog[5:]
         self.path = None
         self.prefix = prefix
         self.version = version
@@ -195,12 +306,49 @@ class CLIPluginRegistry:
 
     default_plugins = ["shape"]
     plugin_namespace = "flux.cli.plugins"
+    callbacks = ("preinit", "modify_jobspec", "validate")
 
     def __init__(self, prog):
         self.prog = prog
-        self.plugins = []
         self.plugindirs = self._get_searchpath()
-        self._load_plugins(self.prog)
+        # Find plugin files now, but defer importing them until the
+        # registry is first used, so that creating a registry which is
+        # never consulted does not pay for importing every plugin.
+        self._pending_paths = [
+            path_mtime
+            for plugindir in self.plugindirs
+            for path_mtime in _find_plugin_files(plugindir)
+        ]
+        self._plugins = []
+        self._options = []
+        self._aliases = {}
+        self._active = {}
+        self._loaded = False
+
+    @property
+    def plugins(self):
+        """List of loaded plugins, loading them on first access"""
+        self._ensure_loaded()
+        return self._plugins
+
+    @property
+    def options(self):
+        """List of options provided by loaded plugins"""
+        self._ensure_loaded()
+        return self._options
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self._load_plugins(self.prog)
+
+    def load(self):
+        """Load plugins now instead of on first use
+
+        Any error importing or initializing a plugin is raised immediately.
+        Returns self so that ``CLIPluginRegistry(prog).load()`` may be chained.
+        """
+        self._ensure_loaded()
+        return self
 
     def print_help(self, name):
         """
@@ -230,86 +378,100 @@ class CLIPluginRegistry:
         Otherwise, prepend any paths from ``FLUX_CLI_PLUGINPATH`` to the
         system default search path.
         """
-        sysdir = conf_builtin_get("confdir")
-        builtindir = conf_builtin_get("libexecdir")
-        builtin_paths = [f"{sysdir}/cli/plugins", f"{builtindir}/cli/plugins"]
-
-        if "FLUX_CLI_PLUGINPATH_OVERRIDE" in os.environ:
-            raw = os.environ["FLUX_CLI_PLUGINPATH_OVERRIDE"]
-            return [s for s in raw.split(":") if s and not s.isspace()]
-
-        paths = list(builtin_paths)
-        if "FLUX_CLI_PLUGINPATH" in os.environ:
-            extra = [
-                s
-                for s in os.environ["FLUX_CLI_PLUGINPATH"].split(":")
-                if s and not s.isspace()
-            ]
-            paths = extra + paths
+        override = os.environ.get("FLUX_CLI_PLUGINPATH_OVERRIDE")
+        if override is not None:
+            return [s for s in override.split(":") if s and not s.isspace()]
+
+        paths = list(_builtin_searchpath())
+
+        extra = os.environ.get("FLUX_CLI_PLUGINPATH")
+        if extra is not None:
+            paths = [s for s in extra.split(":") if s and not s.isspace()] + paths
 
         return paths
 
-    def _add_plugins_from_module(self, module, program):
-        entries = [
-            getattr(module, attr) for attr in dir(module) if not attr.startswith("_")
-        ]
-        for entry in entries:
-            # only process entries that are an instance of type (i.e. a class)
-            # and are a subclass of CLIPlugin, but not the base class:
-            if (
-                isinstance(entry, type)
-                and issubclass(entry, CLIPlugin)
-                and entry != CLIPlugin
-            ):
-                plugin = entry(program)
-                plugin.path = module.__file__
-                self.plugins.append(plugin)
-
-    def _add_plugins(self, path, program):
-        module = import_path(path)
-        self._add_plugins_from_module(module, program)
+    @staticmethod
+    def _create_plugins(module, classes, program):
+        """Return an instance of each plugin class in ``classes``"""
+        plugins = []
+        for entry in classes:
+            plugin = entry(program)
+            plugin.path = module.__file__
+            plugins.append(plugin)
+        return plugins
 
     def print_plugins(self):
         """Print all of the plugins loaded by _load_plugins."""
-        print("Options provided by plugins:")
+        # Collect all lines and write them out with a single print()
+        lines = ["Options provided by plugins:"]
         if self.plugindirs:
-            print(f"  Search path: {':'.join(self.plugindirs)}")
-            print(f"  (plus {self.plugin_namespace} namespace)\n")
+            lines.append(f"  Search path: {':'.join(self.plugindirs)}")
+            lines.append(f"  (plus {self.plugin_namespace} namespace)")
         else:
-            print(f"  Searched only {self.plugin_namespace} namespace\n")
+            lines.append(f"  Searched only {self.plugin_namespace} namespace")
+        lines.append("")
         for plugin in self.plugins:
-            print(f"{type(plugin).__name__} loaded from {plugin.path}")
-            for option in plugin.options:
-                print(f"  {option.name:<20}  {option.kwargs['help']}")
-            print()
+            lines.append(f"{type(plugin).__name__} loaded from {plugin.path}")
+            lines.extend(
+                f"  {option.name:<20}  {option.kwargs['help']}"
+                for option in plugin.options
+            )
+            lines.append("")
+        print("\n".join(lines))
 
     def _load_plugins(self, program):
         """Load all cli plugins from the standard path"""
+        # plugins see only the subcommand name, e.g. "submit" not "flux submit"
+        if program.startswith("flux "):
+            program = program[5:]
+        # Plugins are collected in a local list and only stored in the
+        # registry once all of them load, so that a failed load leaves
+        # the registry unchanged and may be retried.
+        candidates = []
         # First load filesystem plugins from search path
-        for plugindir in self.plugindirs:
-            for path in glob.glob(f"{plugindir}/*.py"):
-                self._add_plugins(path, program)
+        for path, mtime in self._pending_paths:
+            module, classes = _import_plugin_path(path, mtime)
+            candidates.extend(self._create_plugins(module, classes, program))
         # Then load builtin plugins
         packaged = import_plugins(self.plugin_namespace)
         for name in self.default_plugins:
             if name in packaged:
-                self._add_plugins_from_module(packaged[name], program)
+                module = packaged[name]
+                classes = _plugin_classes(module)
+                candidates.extend(self._create_plugins(module, classes, program))
         # keep a dictionary of options:plugin so that conflicts can be checked
         option_dests = {}
-        # because the plugin list can change due to conflicting options, iterate
-        # over a copy, not the list itself
-        for plugin in self.plugins[:]:
+        plugins = []
+        for plugin in candidates:
             if any(opt.dest in option_dests for opt in plugin.options):
-                # remove the current plugin if any of the options conflict (since
+                # skip the current plugin if any of the options conflict (since
                 # it would have come after the 'primary' plugin observed in the
                 # PATH)
-                self.plugins.remove(plugin)
-            else:
-                for opt in plugin.options:
-                    option_dests[opt.dest] = opt
+                continue
+            plugins.append(plugin)
+            for opt in plugin.options:
+                option_dests[opt.dest] = opt
+        self._plugins = plugins
         # finalize all of this by passing a list of argparse arguments (options)
         # to the registry
-        self.options = list(option_dests.values())
+        self._options = list(option_dests.values())
+        # the alias map for each plugin is fixed once plugins are loaded,
+        # so build it here instead of on every callback invocation. Key by
+        # id() since plugins are not required to be hashable, and the
+        # registry keeps each plugin alive in self._plugins.
+        self._aliases = {id(plugin): self._make_alias(plugin) for plugin in plugins}
+        # record only the plugins which override each callback, so that
+        # no-op base class callbacks are never called
+        self._active = {
+            name: [
+                plugin
+                for plugin in plugins
+                if getattr(type(plugin), name) is not getattr(CLIPlugin, name)
+            ]
+            for name in self.callbacks
+        }
+        self._pending_paths = []
+        self._loaded = True
         return self
 
     def _make_alias(self, plugin):
@@ -324,21 +486,31 @@ class CLIPluginRegistry:
             if opt._unprefixed_dest is not None and opt._unprefixed_dest != opt.dest
         }
 
+    def _active_plugins(self, name):
+        """Return the loaded plugins which implement callback ``name``"""
+        self._ensure_loaded()
+        return self._active[name]
+
+    def _plugin_args(self, plugin, args):
+        """Return the args namespace to pass to callbacks of ``plugin``"""
+        alias = self._aliases[id(plugin)]
+        # With no aliases the proxy is a pure pass-through, so skip it and
+        # let the plugin access the namespace directly:
+        return PluginArgsProxy(args, alias) if alias else args
+
     def preinit(self, args):
         """Call all plugin ``preinit`` callbacks"""
-        for plugin in self.plugins:
-            plugin.preinit(PluginArgsProxy(args, self._make_alias(plugin)))
+        for plugin in self._active_plugins("preinit"):
+            plugin.preinit(self._plugin_args(plugin, args))
 
     def modify_jobspec(self, args, jobspec):
         """Call all plugin ``modify_jobspec`` callbacks"""
-        for plugin in self.plugins:
-            plugin.modify_jobspec(
-                PluginArgsProxy(args, self._make_alias(plugin)), jobspec
-            )
+        for plugin in self._active_plugins("modify_jobspec"):
+            plugin.modify_jobspec(self._plugin_args(plugin, args), jobspec)
 
     def validate(self, jobspec):
         """Call any plugin validate callback"""
-        for plugin in self.plugins:
+        for plugin in self._active_plugins("validate"):
             plugin.validate(jobspec)
 
 
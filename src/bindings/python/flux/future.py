@@ -10,22 +10,59 @@
 
 import errno
 import json
-from typing import Dict
+import os
+from typing import Dict, Set
 
 from flux.core.inner import ffi, lib, raw
 from flux.util import check_future_error, interruptible
 from flux.wrapper import Wrapper, WrapperPimpl
 
-# Reference count dictionary to keep futures with a pending `then` callback
-# alive, even if there are no remaining references to the future in the user's
-# program scope. When a callback is first set on the future, add an entry to the
-# dictionary with the future itself as the key and a value of 1. Whenever a
-# future's callback is run, decrement the count in the dictionary for that
-# future, and whenever reset is called on a future, increment the counter. If
-# the counter hits 0, delete the reference to the future from the dictionary.
-_THEN_HANDLES: Dict["Future", int] = {}
+# Resolve frequently used cffi attributes once at import time rather than
+# on every then()/push() call:
+_CONTINUATION_CB = lib.continuation_callback
+_FFI_NULL = ffi.NULL
 
-# Same as above, but for FutureExt init callbacks:
+
+def _future_error_string(c_future):
+    """Return the error string of c_future, or None if it has none
+
+    Calls flux_future_error_string(3) directly rather than through the
+    exception-raising wrapper, since a missing error is the common case.
+    """
+    errmsg = lib.flux_future_error_string(c_future)
+    if errmsg == _FFI_NULL:
+        return None
+    return ffi.string(errmsg)
+
+
+def _future_get_flux(c_future):
+    """Return the flux handle of c_future, or None if it has none
+
+    flux_future_get_flux(3) fails with EINVAL when no handle is set, which
+    is an expected condition, so return None rather than raising. Other
+    errors are still raised as OSError.
+    """
+    ffi.errno = 0
+    flux_handle = lib.flux_future_get_flux(c_future)
+    if flux_handle == _FFI_NULL:
+        errnum = ffi.errno
+        if errnum not in (0, errno.EINVAL):
+            raise OSError(errnum, os.strerror(errnum))
+        return None
+    return flux_handle
+
+
+# Set of futures with a pending `then` callback, which keeps them alive even
+# if there are no remaining references to the future in the user's program
+# scope. The number of outstanding callbacks is tracked in each future's
+# _then_refcount attribute. When a callback is first set on the future, set
+# the count to 1 and add the future to the set. Whenever a future's callback
+# is run, decrement the count, and whenever reset is called on a future,
+# increment it. If the count hits 0, remove the future from the set.
+_THEN_HANDLES: Set["Future"] = set()
+
+# Reference count dictionary to keep futures with a pending init callback
+# alive, as above, but for FutureExt init callbacks:
 _INIT_HANDLES: Dict["Future", int] = {}
 
 
@@ -33,7 +70,10 @@ _INIT_HANDLES: Dict["Future", int] = {}
 def continuation_callback(c_future, opaque_handle):
     try:
         py_future: "Future" = ffi.from_handle(opaque_handle)
-        assert c_future == py_future.pimpl.handle
+        # Sanity check only (compiled out under python -O). Compare against
+        # the wrapper's _handle directly to avoid the `handle` property call
+        # on every dispatch:
+        assert c_future == py_future.pimpl._handle
         if not py_future.stopped:
             py_future.then_cb(py_future, *py_future.then_args, **py_future.then_kwargs)
     # pylint: disable=broad-except
@@ -49,21 +89,20 @@ def continuation_callback(c_future, opaque_handle):
         #
         # Reset this future so it doesn't immediately call the callback
         # again (and fail) if the reactor is restarted. (and bypass
-        # future.reset() to avoid unnecessarily incrementing _THEN_HANDLES
-        # count).
+        # future.reset() to avoid unnecessarily incrementing _then_refcount).
         #
         py_future.pimpl.reset()
         py_future.stop()
 
     finally:
-        if py_future in _THEN_HANDLES:
-            _THEN_HANDLES[py_future] -= 1
-            if _THEN_HANDLES[py_future] <= 0:
+        if py_future._then_refcount > 0:
+            py_future._then_refcount -= 1
+            if py_future._then_refcount == 0:
                 #
                 #  Note, a multiply fulfilled future which is not reset
                 #  before leaving the then_cb() will end up here, since a
                 #  call to reset() is the only thing that increments the
-                #  _THEN_HANDLES counter. If py_future.cb_handle is set
+                #  _then_refcount counter. If py_future.cb_handle is set
                 #  to None at this point, then the handle could be garbage
                 #  collected immediately. If the Future is not also collected,
                 #  then continuation_callback() might be called again with
@@ -71,7 +110,7 @@ def continuation_callback(c_future, opaque_handle):
                 #  abort. Therefore, leave cb_handle defined for the
                 #  lifetime of the Future.
                 #
-                del _THEN_HANDLES[py_future]
+                _THEN_HANDLES.discard(py_future)
 
 
 @ffi.def_extern()
@@ -138,6 +177,7 @@ class Future(WrapperPimpl):
         self.then_args = []
         self.then_kwargs = {}
         self.cb_handle = None
+        self._then_refcount = 0
         self.stopped = False
 
     def stop(self):
@@ -147,10 +187,7 @@ class Future(WrapperPimpl):
         self.stopped = True
 
     def error_string(self):
-        try:
-            errmsg = self.pimpl.error_string()
-        except EnvironmentError:
-            return None
+        errmsg = _future_error_string(self.pimpl.handle)
         return errmsg.decode("utf-8") if errmsg else None
 
     def get_flux(self):
@@ -158,15 +195,8 @@ class Future(WrapperPimpl):
         # pylint: disable=cyclic-import, import-outside-toplevel
         import flux.core.handle
 
-        try:
-            flux_handle = self.pimpl.get_flux()
-        except OSError as exc:
-            #  get_flux() throws OSError of EINVAL if !f->h, but this should
-            #   a valid return (i.e. no flux handle set yet)
-            if exc.errno == errno.EINVAL:
-                return None
-            raise
-        if flux_handle == ffi.NULL:
+        flux_handle = _future_get_flux(self.pimpl.handle)
+        if flux_handle is None:
             return None
         handle = flux.core.handle.Flux(handle=flux_handle)
         # increment reference count to prevent destruction of the underlying handle
@@ -181,7 +211,7 @@ class Future(WrapperPimpl):
         return self.pimpl.get_reactor()
 
     def then(self, callback, *args, timeout=-1.0, **kwargs):
-        if self in _THEN_HANDLES:
+        if self._then_refcount > 0:
             raise EnvironmentError(
                 errno.EEXIST, "then callback already exists for this future"
             )
@@ -191,13 +221,18 @@ class Future(WrapperPimpl):
         self.then_cb = callback
         self.then_args = args
         self.then_kwargs = kwargs
-        self.cb_handle = ffi.new_handle(self)
-        self.pimpl.then(timeout, lib.continuation_callback, self.cb_handle)
+        # cb_handle is kept for the lifetime of the Future (see the comment
+        # in continuation_callback()) and always refers to self, so create
+        # it once and reuse it if then() is called again on this Future.
+        if self.cb_handle is None:
+            self.cb_handle = ffi.new_handle(self)
+        self.pimpl.then(timeout, _CONTINUATION_CB, self.cb_handle)
 
         # ensure that this future object is not garbage collected with a
         # callback outstanding. Particularly important for anonymous calls and
         # streaming RPCs.  For example, `f.rpc('topic').then(cb)`
-        _THEN_HANDLES[self] = 1
+        self._then_refcount = 1
+        _THEN_HANDLES.add(self)
 
         # return self to enable further chaining of the future.
         # For example `f.rpc('topic').then(cb).wait_for(-1)
@@ -209,10 +244,10 @@ class Future(WrapperPimpl):
     def reset(self):
         self.pimpl.reset()
 
-        if self in _THEN_HANDLES:
+        if self._then_refcount > 0:
             # ensure that this future object is not garbage collected with a
             # callback outstanding. Particularly important for streaming RPCs.
-            _THEN_HANDLES[self] += 1
+            self._then_refcount += 1
 
     def is_ready(self):
         return self.pimpl.is_ready()
@@ -264,15 +299,15 @@ class WaitAllFuture(Future):
     """Create a composite future which waits for all children to be fulfilled"""
 
     def __init__(self, children=None):
-        self.children = children
-        if self.children is None:
-            self.children = []
         future = raw.flux_future_wait_all_create()
         super(WaitAllFuture, self).__init__(future)
+        self.children = []
+        if children:
+            self.extend(list(children))
 
     def push(self, child, name=None):
         if name is None:
-            name = ffi.NULL
+            name = _FFI_NULL
         #
         #  if this future does not have a flux handle yet, attempt
         #   to grab from the first pushed "child" future.
@@ -287,6 +322,31 @@ class WaitAllFuture(Future):
         child.pimpl.incref()
         self.children.append(child)
 
+    def extend(self, children, names=None):
+        """Push each future in ``children`` onto this composite future
+
+        This is equivalent to calling :meth:`push` for each child, but
+        this future's flux handle is only checked once for the whole batch.
+        If it is not yet set, it is taken from the first child which has
+        one. If ``names`` is provided, it must contain one name for each
+        child.
+        """
+        if not children:
+            return
+        if self.get_flux() is None:
+            for child in children:
+                flux_handle = child.get_flux()
+                if flux_handle is not None:
+                    self.pimpl.set_flux(flux_handle)
+                    break
+
+        push = self.pimpl.push
+        for i, child in enumerate(children):
+            push(names[i] if names else _FFI_NULL, child)
+            #  See comment in push() above
+            child.pimpl.incref()
+            self.children.append(child)
+
 
 class FutureExt(Future):
     """
@@ -216,8 +216,12 @@ class JobKVSLookup:
         if not self.base:
             flags |= flux.constants.FLUX_JOB_LOOKUP_CURRENT
         listids = JobKVSLookupFuture()
-        for jobid in self.ids:
-            listids.push(job_info_lookup(self.handle, jobid, self.keyslookup, flags))
+        listids.extend(
+            [
+                job_info_lookup(self.handle, jobid, self.keyslookup, flags)
+                for jobid in self.ids
+            ]
+        )
         return listids
 
     def data(self):
@@ -336,8 +336,9 @@ class JobList:
         """
         if self.ids:
             listids = JobListIdsFuture()
-            for jobid in self.ids:
-                listids.push(job_list_id(self.handle, jobid, self.attrs))
+            listids.extend(
+                [job_list_id(self.handle, jobid, self.attrs) for jobid in self.ids]
+            )
             return listids
         return job_list(
             self.handle,
@@ -48,7 +48,9 @@ class Validator(ValidatorPlugin):
                 raise ValueError(f"Invalid argument to --require-version")
             self.require_version = None
 
-        self.plugins = CLIPluginRegistry("validate")
+        # Load CLI plugins now so that a broken plugin is reported once at
+        # startup rather than on every validated job:
+        self.plugins = CLIPluginRegistry("validate").load()
 
     def validate(self, args):
         result, jobspec = validate_jobspec(
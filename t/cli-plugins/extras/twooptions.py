@@ -10,6 +10,8 @@
 
 from flux.cli.plugin import CLIPlugin
 
+_BATCH_ALLOC_PROGS = frozenset({"batch", "alloc"})
+
 
 class FluxionPlugin(CLIPlugin):
     """Accept command-line option that updates fluxion config in subinstance"""
@@ -29,19 +31,18 @@ class FluxionPlugin(CLIPlugin):
 
     def preinit(self, args):
         pol = args.match_policy
-        if self.prog in ("batch", "alloc"):
+        if self.prog in _BATCH_ALLOC_PROGS:
             if pol:
                 args.conf.update(f'sched-fluxion-resource.match-policy="{pol}"')
             if args.feasibility:
                 args.conf.update("ingest.validator.plugins=['jobspec', 'feasibility']")
 
     def modify_jobspec(self, args, jobspec):
-        jobspec.setattr("system.fluxion_match_policy", str(args.match_policy))
+        if args.match_policy is not None:
+            jobspec.setattr("system.fluxion_match_policy", args.match_policy)
 
     def validate(self, jobspec):
-        try:
-            pol = jobspec.attributes["system"]["fluxion_match_policy"]
-        except KeyError:
-            pol = "None"
+        system = jobspec.attributes.get("system", {})
+        pol = system.get("fluxion_match_policy", "None")
         if pol != "firstnodex" and pol != "None":
             raise ValueError(f"Invalid option for fluxion-match-policy: {pol}")
@@ -10,6 +10,11 @@
 
 from flux.cli.plugin import CLIPlugin
 
+_BATCH_ALLOC_PROGS = frozenset({"batch", "alloc"})
+
+# Map each valid --gpumode to whether it requires resource rediscovery
+_GPUMODE_ACTIONS = {"TPX": True, "CPX": True, "SPX": False}
+
 
 class RediscoverGPUPlugin(CLIPlugin):
     """Set the AMD SMI compute partition GPU option.
@@ -29,14 +34,12 @@ class RediscoverGPUPlugin(CLIPlugin):
         )
 
     def preinit(self, args):
-        if self.prog in ("batch", "alloc") and args.gpumode:
-            gpumode = args.gpumode
-            if gpumode == "TPX" or gpumode == "CPX":
-                args.conf.update("resource.rediscover=true")
-            elif gpumode == "SPX" or gpumode is None:
-                pass
-            else:
+        if self.prog in _BATCH_ALLOC_PROGS and args.gpumode:
+            rediscover = _GPUMODE_ACTIONS.get(args.gpumode)
+            if rediscover is None:
                 raise ValueError("--gpumode can only be set to CPX, TPX, or SPX")
+            if rediscover:
+                args.conf.update("resource.rediscover=true")
 
     def modify_jobspec(self, args, jobspec):
         if args.gpumode:
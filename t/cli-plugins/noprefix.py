@@ -11,6 +11,8 @@
 import flux
 from flux.cli.plugin import CLIPlugin
 
+_BATCH_ALLOC_PROGS = frozenset({"batch", "alloc"})
+
 RC1 = """\
 #!/bin/sh
 flux exec sh -c 'chmod uo+x $(flux getattr rundir)'
@@ -22,7 +24,7 @@ class MultiUserPlugin(CLIPlugin):
 
     def __init__(self, prog, prefix=None):
         super().__init__(prog, prefix=prefix)
-        if self.prog in ("batch", "alloc"):
+        if self.prog in _BATCH_ALLOC_PROGS:
             self.add_option(
                 "--multi-user",
                 action="store_true",
@@ -30,7 +32,7 @@ class MultiUserPlugin(CLIPlugin):
             )
 
     def preinit(self, args):
-        if self.prog in ("batch", "alloc") and args.multi_user:
+        if self.prog in _BATCH_ALLOC_PROGS and args.multi_user:
             imp = flux.Flux().conf_get("exec.imp")
             if imp is None:
                 raise ValueError("Can only use --multi-user within multi-user instance")
@@ -46,5 +48,5 @@ class MultiUserPlugin(CLIPlugin):
                 args.env = [env_arg]
 
     def modify_jobspec(self, args, jobspec):
-        if self.prog in ("batch", "alloc") and args.multi_user:
+        if self.prog in _BATCH_ALLOC_PROGS and args.multi_user:
             jobspec.add_file("rc1.d/rc1", RC1, perms=0o700, encoding="utf-8")
@@ -17,38 +17,36 @@ class ValidateShellVerboseOpt(CLIPlugin):
     name = "shell.options.verbose"
 
     def validate(self, jobspec):
-        try:
-            verbosity = jobspec.attributes["system"]["shell"]["options"]["verbose"]
-            if not isinstance(verbosity, int):
-                raise ValueError(
-                    f"{self.name}: expected integer, got {type(verbosity)}"
-                )
-        except KeyError:
+        system = jobspec.attributes.get("system", {})
+        options = system.get("shell", {}).get("options", {})
+        if "verbose" not in options:
             return
+        verbosity = options["verbose"]
+        if not isinstance(verbosity, int):
+            raise ValueError(f"{self.name}: expected integer, got {type(verbosity)}")
 
 
 class ValidateShellSignalOpt(CLIPlugin):
     name = "shell.options.signal"
 
     def validate(self, jobspec):
-        try:
-            signal = jobspec.attributes["system"]["shell"]["options"]["signal"]
-            if isinstance(signal, int):
-                return
-            if not isinstance(signal, Mapping):
-                raise ValueError(
-                    f"{self.name}: expected int or mapping got {type(signal)}"
-                )
-            for name in ("signum", "timeleft"):
-                if name in signal:
-                    if not isinstance(signal[name], int):
-                        typename = type(signal[name])
-                        raise ValueError(
-                            f"{self.name}.{name}: expected integer, got {typename}"
-                        )
-            # Check for extra keys:
-            extra_keys = set(signal.keys()) - {"signum", "timeleft"}
-            if extra_keys:
-                raise ValueError(f"{self.name}: unsupported keys: {extra_keys}")
-        except KeyError:
+        system = jobspec.attributes.get("system", {})
+        options = system.get("shell", {}).get("options", {})
+        if "signal" not in options:
             return
+        signal = options["signal"]
+        if isinstance(signal, int):
+            return
+        if not isinstance(signal, Mapping):
+            raise ValueError(f"{self.name}: expected int or mapping got {type(signal)}")
+        for name in ("signum", "timeleft"):
+            if name in signal:
+                if not isinstance(signal[name], int):
+                    typename = type(signal[name])
+                    raise ValueError(
+                        f"{self.name}.{name}: expected integer, got {typename}"
+                    )
+        # Check for extra keys:
+        extra_keys = set(signal.keys()) - {"signum", "timeleft"}
+        if extra_keys:
+            raise ValueError(f"{self.name}: unsupported keys: {extra_keys}")
@@ -17,7 +17,7 @@ import unittest
 import flux
 import flux.constants
 from flux.core.inner import ffi
-from flux.future import Future, FutureExt
+from flux.future import Future, FutureExt, WaitAllFuture
 from subflux import rerun_under_flux
 
 
@@ -173,6 +173,16 @@ class TestHandle(unittest.TestCase):
             rpc.then(lambda x: None)
         self.assertEqual(cm.exception.errno, errno.EEXIST)
 
+    def test_04_future_then_after_callback(self):
+        """then() may be called again once the previous callback has run"""
+        calls = []
+        rpc = self.f.rpc("broker.ping", payload=self.ping_payload)
+        rpc.then(lambda x: calls.append(1))
+        self.f.reactor_run()
+        rpc.then(lambda x: calls.append(2))
+        self.f.reactor_run()
+        self.assertEqual(calls, [1, 2])
+
     def test_05_future_error_string(self):
         with self.assertRaises(EnvironmentError) as cm:
             payload = {"J": "", "urgency": -1000, "flags": 0}
@@ -250,6 +260,23 @@ class TestHandle(unittest.TestCase):
         with self.assertRaises(EnvironmentError):
             new_fut.get()
 
+    def test_10_wait_all_future(self):
+        rpcs = [self.f.rpc("broker.ping", payload=self.ping_payload) for i in range(4)]
+        fut = WaitAllFuture(rpcs)
+        self.assertEqual(fut.children, rpcs)
+        fut.wait_for(5.0)
+        self.assertTrue(fut.is_ready())
+        for child in fut.children:
+            self.assertTrue(child.is_ready())
+
+        fut = WaitAllFuture()
+        fut.extend(
+            [self.f.rpc("broker.ping", payload=self.ping_payload) for i in range(4)]
+        )
+        self.assertEqual(len(fut.children), 4)
+        fut.wait_for(5.0)
+        self.assertTrue(fut.is_ready())
+
     def test_20_FutureExt(self):
         cb_ran = [False]
 
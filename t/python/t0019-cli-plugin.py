@@ -70,6 +70,32 @@ class TestCLIPluginOption(unittest.TestCase):
         self.assertIsNone(opt._unprefixed_dest)
 
 
+class TestCLIPlugin(unittest.TestCase):
+    """CLIPlugin instance attributes."""
+
+    def test_01_slotted_subclass_has_no_dict(self):
+        # a subclass declaring empty __slots__ carries no instance __dict__
+        class P(CLIPlugin):
+            __slots__ = ()
+
+            def __init__(self, prog, prefix="site"):
+                super().__init__(prog, prefix=prefix)
+                self.add_option("--my-option")
+
+        plugin = P("submit")
+        self.assertFalse(hasattr(plugin, "__dict__"))
+        self.assertEqual(plugin.options[0].dest, "site_my_option")
+
+    def test_02_subclass_may_add_attributes(self):
+        # subclasses without __slots__ can still set arbitrary attributes
+        class P(CLIPlugin):
+            def __init__(self, prog):
+                super().__init__(prog)
+                self.extra = "value"
+
+        self.assertEqual(P("submit").extra, "value")
+
+
 class TestPluginArgsProxy(unittest.TestCase):
     """PluginArgsProxy attribute access and mutation."""
 
@@ -114,23 +140,37 @@ class TestPluginArgsProxy(unittest.TestCase):
         self.assertEqual(ns.x, 99)
 
 
-class TestMakeAlias(unittest.TestCase):
+class PluginPathTestCase(unittest.TestCase):
+    """Base class for tests which set FLUX_CLI_PLUGINPATH_OVERRIDE.
+
+    The original value of the variable is restored after each test.
+    """
+
+    def setUp(self):
+        saved = os.environ.get("FLUX_CLI_PLUGINPATH_OVERRIDE")
+        self.addCleanup(self._restore_pluginpath, saved)
+
+    @staticmethod
+    def _restore_pluginpath(saved):
+        if saved is None:
+            os.environ.pop("FLUX_CLI_PLUGINPATH_OVERRIDE", None)
+        else:
+            os.environ["FLUX_CLI_PLUGINPATH_OVERRIDE"] = saved
+
+
+class TestMakeAlias(PluginPathTestCase):
     """CLIPluginRegistry._make_alias() builds the right per-plugin alias map."""
 
     def setUp(self):
         # Empty plugin dir so the registry loads no plugins from disk;
         # plugins are constructed inline in each test.
+        super().setUp()
         self._plugin_dir = tempfile.mkdtemp()
-        self._saved = os.environ.get("FLUX_CLI_PLUGINPATH_OVERRIDE")
         os.environ["FLUX_CLI_PLUGINPATH_OVERRIDE"] = self._plugin_dir
         self._registry = CLIPluginRegistry("submit")
 
     def tearDown(self):
         shutil.rmtree(self._plugin_dir)
-        if self._saved is None:
-            os.environ.pop("FLUX_CLI_PLUGINPATH_OVERRIDE", None)
-        else:
-            os.environ["FLUX_CLI_PLUGINPATH_OVERRIDE"] = self._saved
 
     def test_01_prefixed_plugin_alias_maps_old_to_new(self):
         # a plugin with a prefix gets an alias from unprefixed to prefixed dest
@@ -164,7 +204,7 @@ class TestMakeAlias(unittest.TestCase):
         self.assertEqual(alias, {})
 
 
-class TestConflictDetection(unittest.TestCase):
+class TestConflictDetection(PluginPathTestCase):
     """CLIPluginRegistry detects dest conflicts at load time."""
 
     PLUGIN_SITE = textwrap.dedent(
@@ -197,15 +237,6 @@ class TestConflictDetection(unittest.TestCase):
     """
     )
 
-    def setUp(self):
-        self._saved = os.environ.get("FLUX_CLI_PLUGINPATH_OVERRIDE")
-
-    def tearDown(self):
-        if self._saved is None:
-            os.environ.pop("FLUX_CLI_PLUGINPATH_OVERRIDE", None)
-        else:
-            os.environ["FLUX_CLI_PLUGINPATH_OVERRIDE"] = self._saved
-
     def test_01_same_prefix_same_name_first_wins(self):
         # two plugins with the same prefix and option produce identical dests
         with tempfile.TemporaryDirectory() as d:
@@ -239,5 +270,226 @@ class TestConflictDetection(unittest.TestCase):
             self.assertIn("vendor_my_option", dests)
 
 
+class TestPluginDiscovery(PluginPathTestCase):
+    """CLIPluginRegistry finds the plugin classes provided by a module."""
+
+    PLUGIN_EXPLICIT = textwrap.dedent(
+        """\
+        from flux.cli.plugin import CLIPlugin
+        class Listed(CLIPlugin):
+            pass
+        class Unlisted(CLIPlugin):
+            pass
+        __flux_cli_plugins__ = [Listed]
+    """
+    )
+
+    PLUGIN_IMPORTED = textwrap.dedent(
+        """\
+        from flux.cli.plugin import CLIPlugin
+        from flux.cli.plugins.shape import ShapePlugin
+        class Local(CLIPlugin):
+            pass
+    """
+    )
+
+    PLUGIN_DERIVED = textwrap.dedent(
+        """\
+        from flux.cli.plugin import CLIPlugin
+        class Base(CLIPlugin):
+            pass
+        class Derived(Base):
+            pass
+        class _Private(CLIPlugin):
+            pass
+    """
+    )
+
+    PLUGIN_UNSORTED = textwrap.dedent(
+        """\
+        from flux.cli.plugin import CLIPlugin
+        class Zebra(CLIPlugin):
+            pass
+        class Aardvark(CLIPlugin):
+            pass
+    """
+    )
+
+    def _loaded_from(self, source):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "plugin.py")
+            with open(path, "w") as f:
+                f.write(source)
+            os.environ["FLUX_CLI_PLUGINPATH_OVERRIDE"] = d
+            registry = CLIPluginRegistry("submit")
+            return [type(p).__name__ for p in registry.plugins if p.path == path]
+
+    def test_01_explicit_plugin_list(self):
+        # only classes listed in __flux_cli_plugins__ are loaded
+        self.assertEqual(self._loaded_from(self.PLUGIN_EXPLICIT), ["Listed"])
+
+    def test_02_imported_classes_ignored(self):
+        # CLIPlugin subclasses imported from other modules are not loaded
+        self.assertEqual(self._loaded_from(self.PLUGIN_IMPORTED), ["Local"])
+
+    def test_03_derived_plugin_classes(self):
+        # plugin classes derived from another plugin in the module are found
+        self.assertEqual(self._loaded_from(self.PLUGIN_DERIVED), ["Base", "Derived"])
+
+    def test_04_plugins_imported_on_first_use(self):
+        # plugin files are not imported until the registry is first used
+        with tempfile.TemporaryDirectory() as d:
+            with open(os.path.join(d, "broken.py"), "w") as f:
+                f.write("raise ImportError('imported')\n")
+            os.environ["FLUX_CLI_PLUGINPATH_OVERRIDE"] = d
+            registry = CLIPluginRegistry("submit")
+            with self.assertRaises(ImportError):
+                registry.options
+
+    def test_05_failed_load_is_not_partial(self):
+        # a plugin import failure leaves no partially loaded plugins behind,
+        # so that each retry raises the same error
+        with tempfile.TemporaryDirectory() as d:
+            with open(os.path.join(d, "a_good.py"), "w") as f:
+                f.write(self.PLUGIN_DERIVED)
+            with open(os.path.join(d, "b_broken.py"), "w") as f:
+                f.write("raise ImportError('imported')\n")
+            os.environ["FLUX_CLI_PLUGINPATH_OVERRIDE"] = d
+            registry = CLIPluginRegistry("submit")
+            for i in range(3):
+                with self.assertRaises(ImportError):
+                    registry.validate(None)
+                self.assertEqual(registry._plugins, [])
+            with self.assertRaises(ImportError):
+                registry.load()
+
+    def test_06_bad_plugin_entry_is_not_ignored(self):
+        # an unreadable entry in a plugin directory raises an error rather
+        # than silently dropping the other plugins in that directory
+        with tempfile.TemporaryDirectory() as d:
+            with open(os.path.join(d, "good.py"), "w") as f:
+                f.write(self.PLUGIN_DERIVED)
+            os.symlink("loop.py", os.path.join(d, "loop.py"))
+            os.environ["FLUX_CLI_PLUGINPATH_OVERRIDE"] = d
+            with self.assertRaises(OSError):
+                CLIPluginRegistry("submit").load()
+
+    def test_07_missing_plugin_dir_is_skipped(self):
+        # a nonexistent directory in the search path is ignored
+        with tempfile.TemporaryDirectory() as d:
+            os.environ["FLUX_CLI_PLUGINPATH_OVERRIDE"] = os.path.join(d, "none")
+            CLIPluginRegistry("submit").load()
+
+    def test_08_plugins_loaded_in_name_order(self):
+        # plugins from one file are loaded sorted by name, not definition order
+        self.assertEqual(self._loaded_from(self.PLUGIN_UNSORTED), ["Aardvark", "Zebra"])
+
+
+class TestCallbacks(PluginPathTestCase):
+    """CLIPluginRegistry only calls callbacks a plugin overrides."""
+
+    PLUGIN_VALIDATE = textwrap.dedent(
+        """\
+        from flux.cli.plugin import CLIPlugin
+        class ValidateOnly(CLIPlugin):
+            def validate(self, jobspec):
+                raise ValueError("validate called")
+    """
+    )
+
+    PLUGIN_EQ = textwrap.dedent(
+        """\
+        from flux.cli.plugin import CLIPlugin
+        class EqPlugin(CLIPlugin):
+            def __init__(self, prog):
+                super().__init__(prog, prefix="eq")
+                self.add_option("--eq-option", help="unused")
+            def __eq__(self, other):
+                return type(self) is type(other)
+            def modify_jobspec(self, args, jobspec):
+                raise ValueError("eq modify_jobspec called")
+    """
+    )
+
+    def setUp(self):
+        super().setUp()
+        self._plugin_dir = tempfile.mkdtemp()
+        with open(os.path.join(self._plugin_dir, "validate.py"), "w") as f:
+            f.write(self.PLUGIN_VALIDATE)
+        os.environ["FLUX_CLI_PLUGINPATH_OVERRIDE"] = self._plugin_dir
+        self._registry = CLIPluginRegistry("submit")
+
+    def tearDown(self):
+        shutil.rmtree(self._plugin_dir)
+
+    def _active(self, name):
+        return [type(p).__name__ for p in self._registry._active_plugins(name)]
+
+    def test_01_overridden_callback_is_active(self):
+        # a plugin overriding validate is called from registry.validate()
+        self.assertIn("ValidateOnly", self._active("validate"))
+        with self.assertRaisesRegex(ValueError, "validate called"):
+            self._registry.validate(None)
+
+    def test_02_inherited_callbacks_are_skipped(self):
+        # a plugin is not dispatched for callbacks it does not override
+        self.assertNotIn("ValidateOnly", self._active("preinit"))
+        self.assertNotIn("ValidateOnly", self._active("modify_jobspec"))
+
+    def test_03_plugin_prog_strips_flux_prefix(self):
+        # plugins are created with the bare subcommand name
+        registry = CLIPluginRegistry("flux submit")
+        self.assertEqual({p.prog for p in registry.plugins}, {"submit"})
+
+    def test_04_no_proxy_without_aliases(self):
+        # a plugin with no aliased options is passed the args namespace as-is
+        (plugin,) = self._registry._active_plugins("validate")
+        args = SimpleNamespace()
+        self.assertIs(self._registry._plugin_args(plugin, args), args)
+
+    def test_05_unhashable_plugin(self):
+        # a plugin defining __eq__ without __hash__ is unhashable, but
+        # still loads and has its callbacks called
+        with open(os.path.join(self._plugin_dir, "eq.py"), "w") as f:
+            f.write(self.PLUGIN_EQ)
+        registry = CLIPluginRegistry("submit")
+        self.assertIn("EqPlugin", [type(p).__name__ for p in registry.plugins])
+        with self.assertRaisesRegex(ValueError, "eq modify_jobspec called"):
+            registry.modify_jobspec(SimpleNamespace(), None)
+
+
+class TestModuleCache(PluginPathTestCase):
+    """Plugin files are imported once per process unless modified."""
+
+    def setUp(self):
+        super().setUp()
+        self._plugin_dir = tempfile.mkdtemp()
+        self._path = os.path.join(self._plugin_dir, "cached.py")
+        with open(self._path, "w") as f:
+            f.write(TestConflictDetection.PLUGIN_SITE)
+        os.environ["FLUX_CLI_PLUGINPATH_OVERRIDE"] = self._plugin_dir
+
+    def tearDown(self):
+        shutil.rmtree(self._plugin_dir)
+
+    def _plugin_class(self):
+        registry = CLIPluginRegistry("submit")
+        for plugin in registry.plugins:
+            if type(plugin).__name__ == "PluginSite":
+                return type(plugin)
+        self.fail("PluginSite not loaded")
+
+    def test_01_unmodified_plugin_is_not_reimported(self):
+        # a second registry reuses the module imported by the first
+        self.assertIs(self._plugin_class(), self._plugin_class())
+
+    def test_02_modified_plugin_is_reimported(self):
+        # changing the plugin file's mtime forces a fresh import
+        first = self._plugin_class()
+        stat = os.stat(self._path)
+        os.utime(self._path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertIsNot(first, self._plugin_class())
+
+
 if __name__ == "__main__":
     unittest.main(testRunner=TAPTestRunner())
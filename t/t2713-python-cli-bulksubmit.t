@@ -244,6 +244,18 @@ test_expect_success 'flux bulksubmit --define works' '
 	EOF
 	test_cmp define.expected define.out
 '
+test_expect_success 'flux bulksubmit --define allows = in CODE' '
+	flux bulksubmit --dry-run \
+	    --define=odd="\"yes\" if int(x) % 2 == 1 else \"no\"" \
+	    --job-name={.odd} hostname ::: 1 2 \
+	    >define2.out &&
+	test_debug "cat define2.out" &&
+	cat <<-EOF >define2.expected &&
+	bulksubmit: submit --job-name=yes hostname
+	bulksubmit: submit --job-name=no hostname
+	EOF
+	test_cmp define2.expected define2.out
+'
 test_expect_success 'flux bulksubmit --shuffle works' '
 	flux bulksubmit --dry-run --shuffle \
 	    {seq}:{} ::: $(seq 1 8) >shuffle.out &&